@@ -21,20 +21,22 @@ Usage:
 """
 
 import argparse
-import os
+import functools
+import io
 import re
 import shutil
 import sys
-import tempfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
 
 from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
-from docx.shared import Pt, Twips, RGBColor
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Emu, Pt
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -55,37 +57,95 @@ STYLE_NUMBERED_SUBHEADING = "SPRIND - Nummerierte Unterüberschrift"
 
 FONT_BODY = "GT America Light"
 
-# German detection words
-GERMAN_MARKERS = {
+# German detection words (all lower-case; detect_language() lowers tokens)
+GERMAN_MARKERS = frozenset(sys.intern(w) for w in (
     "der", "die", "das", "und", "oder", "für", "über", "aber", "nach",
     "mit", "von", "bei", "seit", "wird", "werden", "haben", "sein",
     "einen", "einer", "eines", "einem", "nicht", "auch", "sich",
     "dass", "diese", "dieser", "dieses", "diesem", "können", "müssen",
     "sollen", "zwischen", "durch", "bereits", "sowie", "jedoch",
     "gegenüber", "während", "innerhalb", "außerdem", "grundsätzlich",
+))
+
+# Ratio of marker words above which text is considered German
+GERMAN_RATIO = 0.03
+# After this many words, stop scanning once the ratio is clearly on one side
+LANGUAGE_SAMPLE_WORDS = 2000
+
+# Precompiled patterns for the markdown parser and language detection.
+# _BLOCK_RE covers heading, bullet and numbered lines; the name of the text
+# group that matched (m.lastgroup) is the block kind.
+_BLOCK_RE = re.compile(
+    r"^(?:(?P<hashes>#{1,6})\s+(?P<heading>.+)"
+    r"|[-*+]\s+(?P<bullet>.+)"
+    r"|\d+[.)]\s+(?P<numbered>.+))$"
+)
+_PARA_GUARD_RE = re.compile(r"^(#{1,6}\s|[-*+]\s|\d+[.)]\s)")
+_INLINE_RE = re.compile(r"(\*\*(.+?)\*\*|\*(.+?)\*|__(.+?)__|([^*_]+))")
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# First characters that can open a heading/list line; anything else is
+# a paragraph continuation without consulting the regex
+_BLOCK_START = frozenset("#-*+0123456789")
+
+# Tabs and line breaks become <w:tab/> / <w:br/> rather than literal text
+_RUN_BREAK_RE = re.compile(r"([\t\r\n])")
+
+# Run properties for each (bold, italic, underline) combination of inline markup
+_INLINE_RPR_XML = {
+    (bold, italic, underline): (
+        "<w:rPr>"
+        + ("<w:b/>" if bold else "")
+        + ("<w:i/>" if italic else "")
+        + ('<w:u w:val="single"/>' if underline else "")
+        + "</w:rPr>"
+    ) if bold or italic or underline else ""
+    for bold in (False, True)
+    for italic in (False, True)
+    for underline in (False, True)
 }
 
+# Table properties python-docx's add_table() would set (no table style)
+_TABLE_PR_XML = (
+    '<w:tblPr><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+)
+
+# Run properties for table cells, keyed by whether the cell is bold
+_TABLE_RPR_XML = {
+    bold: (
+        f'<w:rPr><w:rFonts w:ascii="{FONT_BODY}" w:hAnsi="{FONT_BODY}"/>'
+        + ("<w:b/>" if bold else "")
+        + '<w:color w:val="000000"/><w:sz w:val="22"/></w:rPr>'
+    )
+    for bold in (False, True)
+}
+
+# Pre-resolved WordprocessingML tag names
+_QN_P = qn("w:p")
+_QN_PPR = qn("w:pPr")
+_QN_SECTPR = qn("w:sectPr")
+_QN_TBL = qn("w:tbl")
+
 
 # ---------------------------------------------------------------------------
 # Template loading
 # ---------------------------------------------------------------------------
 
-def load_template() -> Document:
-    """Load the SPRIND .dotx template as a .docx Document.
+@functools.lru_cache(maxsize=1)
+def _template_bytes(path: str, mtime_ns: int) -> bytes:
+    """Return the .dotx at ``path`` repackaged as .docx bytes.
 
-    python-docx refuses to open .dotx files directly, so we copy to a
-    temporary .docx and patch the content type inside the ZIP.
+    Cached per (path, mtime) so repeated documents in one process only
+    rebuild the package when the template file changes. Members are
+    stored uncompressed: the buffer is only read back by python-docx,
+    which compresses parts itself on save.
     """
-    if not TEMPLATE_DOTX.exists():
-        print(f"Error: Template not found: {TEMPLATE_DOTX}", file=sys.stderr)
-        sys.exit(1)
-
-    tmp = tempfile.NamedTemporaryFile(suffix=".docx", delete=False)
-    tmp.close()
-
+    buf = io.BytesIO()
     # Read the .dotx, swap content type to .docx, write out
-    with zipfile.ZipFile(str(TEMPLATE_DOTX), "r") as zin:
-        with zipfile.ZipFile(tmp.name, "w", zipfile.ZIP_DEFLATED) as zout:
+    with zipfile.ZipFile(path, "r") as zin:
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zout:
             for name in zin.namelist():
                 data = zin.read(name)
                 if name == "[Content_Types].xml":
@@ -94,23 +154,37 @@ def load_template() -> Document:
                         b"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml",
                     )
                 zout.writestr(name, data)
+    return buf.getvalue()
 
-    doc = Document(tmp.name)
-    os.unlink(tmp.name)
-    return doc
+
+def load_template() -> Document:
+    """Load the SPRIND .dotx template as a .docx Document.
+
+    python-docx refuses to open .dotx files directly, so we patch the
+    content type inside the ZIP and open the result from memory.
+    """
+    if not TEMPLATE_DOTX.exists():
+        print(f"Error: Template not found: {TEMPLATE_DOTX}", file=sys.stderr)
+        sys.exit(1)
+
+    data = _template_bytes(str(TEMPLATE_DOTX), TEMPLATE_DOTX.stat().st_mtime_ns)
+    return Document(io.BytesIO(data))
 
 
 def clear_body(doc: Document):
     """Remove all body paragraphs from the document, preserving section properties."""
     body = doc.element.body
-    for p in list(body.findall(qn("w:p"))):
-        # Keep the paragraph that contains sectPr (section properties)
-        if p.find(f"{qn('w:pPr')}/{qn('w:sectPr')}") is not None:
-            continue
-        body.remove(p)
-    # Also remove any tables from template
-    for tbl in list(body.findall(qn("w:tbl"))):
-        body.remove(tbl)
+    for child in list(body):
+        tag = child.tag
+        if tag == _QN_P:
+            # Keep the paragraph that contains sectPr (section properties)
+            ppr = child.find(_QN_PPR)
+            if ppr is not None and ppr.find(_QN_SECTPR) is not None:
+                continue
+            body.remove(child)
+        elif tag == _QN_TBL:
+            # Also remove any tables from template
+            body.remove(child)
 
 
 # ---------------------------------------------------------------------------
@@ -119,12 +193,24 @@ def clear_body(doc: Document):
 
 def detect_language(text: str) -> str:
     """Detect whether text is primarily German or English."""
-    words = re.findall(r"\b\w+\b", text.lower())
-    if not words:
+    total = 0
+    german_count = 0
+    # Lower-case per token rather than copying the whole text up front
+    for m in _WORD_RE.finditer(text):
+        total += 1
+        word = m.group()
+        if not word.islower():
+            word = word.lower()
+        if word in GERMAN_MARKERS:
+            german_count += 1
+        if total % LANGUAGE_SAMPLE_WORDS == 0:
+            ratio = german_count / total
+            if ratio < 0.005 or ratio > 0.10:
+                break
+    if not total:
         return "en"
-    german_count = sum(1 for w in words if w in GERMAN_MARKERS)
-    ratio = german_count / len(words)
-    return "de" if ratio > 0.03 else "en"
+    ratio = german_count / total
+    return "de" if ratio > GERMAN_RATIO else "en"
 
 
 # ---------------------------------------------------------------------------
@@ -145,16 +231,34 @@ def format_date_german(date_str: str | None) -> str:
     return dt.strftime("%d.%m.%Y")
 
 
+# Accepted --date formats; the last one that matched is moved to the front
+_DATE_FORMATS = ["%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y", "%B %d, %Y", "%d %B %Y"]
+
+
 def _parse_date(date_str: str | None) -> datetime:
     """Parse a date string in various formats, default to today."""
     if not date_str:
         return datetime.now()
-    for fmt in ("%d.%m.%Y", "%Y-%m-%d", "%d/%m/%Y", "%B %d, %Y", "%d %B %Y"):
+    dt = _parse_date_string(date_str)
+    return dt if dt is not None else datetime.now()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_date_string(date_str: str) -> datetime | None:
+    """Parse date_str with the known formats, or None if none matches."""
+    for idx, fmt in enumerate(_DATE_FORMATS):
         try:
-            return datetime.strptime(date_str, fmt)
+            dt = datetime.strptime(date_str, fmt)
         except ValueError:
             continue
-    return datetime.now()
+        if idx:
+            _DATE_FORMATS.insert(0, _DATE_FORMATS.pop(idx))
+        return dt
+    # Other ISO 8601 spellings (e.g. with a time part)
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -163,56 +267,70 @@ def _parse_date(date_str: str | None) -> datetime:
 
 class ContentBlock:
     """Represents a parsed content block."""
-    def __init__(self, kind: str, text: str, level: int = 0, table_data: list = None):
+    def __init__(self, kind: str, text: str, level: int = 0, table_data: list = None, runs: list = None):
         self.kind = kind      # "heading", "paragraph", "bullet", "numbered", "table"
         self.text = text
         self.level = level    # heading level (1, 2, 3...)
         self.table_data = table_data  # list of rows, each row is list of cell texts
+        self.runs = runs      # (text, bold, italic, underline) tuples; None = parse text
+
+
+def _is_block_start(line: str) -> bool:
+    """Return True if a stripped line starts a heading or list item."""
+    return line[:1] in _BLOCK_START and _PARA_GUARD_RE.match(line) is not None
+
+
+def _iter_lines(text: str):
+    """Yield the \n-separated lines of text without building a list of them."""
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
 
 
 def parse_markdown(text: str) -> list[ContentBlock]:
     """Parse markdown text into ContentBlock list."""
     blocks = []
-    lines = text.strip().split("\n")
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+    lines = _iter_lines(text)
+    pending = None  # line read ahead by the paragraph loop
+    while True:
+        if pending is not None:
+            stripped, pending = pending, None
+        else:
+            line = next(lines, None)
+            if line is None:
+                break
+            stripped = line.strip()
 
         # Empty line
         if not stripped:
-            i += 1
             continue
 
-        # Heading
-        m = re.match(r"^(#{1,6})\s+(.+)$", stripped)
+        # Heading, bullet or numbered list item
+        m = _BLOCK_RE.match(stripped)
         if m:
-            level = len(m.group(1))
-            blocks.append(ContentBlock("heading", m.group(2).strip(), level=level))
-            i += 1
-            continue
-
-        # Bullet list
-        m = re.match(r"^[-*+]\s+(.+)$", stripped)
-        if m:
-            blocks.append(ContentBlock("bullet", m.group(1).strip()))
-            i += 1
-            continue
-
-        # Numbered list
-        m = re.match(r"^\d+[.)]\s+(.+)$", stripped)
-        if m:
-            blocks.append(ContentBlock("numbered", m.group(1).strip()))
-            i += 1
+            kind = m.lastgroup
+            level = len(m.group("hashes")) if kind == "heading" else 0
+            block_text = m.group(kind).strip()
+            blocks.append(ContentBlock(kind, block_text, level=level, runs=parse_inline(block_text)))
             continue
 
         # Regular paragraph (collect consecutive non-empty lines)
         para_lines = [stripped]
-        i += 1
-        while i < len(lines) and lines[i].strip() and not re.match(r"^(#{1,6}\s|[-*+]\s|\d+[.)]\s)", lines[i].strip()):
-            para_lines.append(lines[i].strip())
-            i += 1
-        blocks.append(ContentBlock("paragraph", " ".join(para_lines)))
+        for line in lines:
+            next_line = line.strip()
+            if not next_line:
+                break
+            if _is_block_start(next_line):
+                pending = next_line
+                break
+            para_lines.append(next_line)
+        para_text = " ".join(para_lines)
+        blocks.append(ContentBlock("paragraph", para_text, runs=parse_inline(para_text)))
 
     return blocks
 
@@ -221,8 +339,7 @@ def parse_inline(text: str) -> list[tuple]:
     """Parse inline markdown (bold, italic, underline) into runs.
     Returns list of (text, bold, italic, underline) tuples."""
     runs = []
-    pattern = r"(\*\*(.+?)\*\*|\*(.+?)\*|__(.+?)__|([^*_]+))"
-    for m in re.finditer(pattern, text):
+    for m in _INLINE_RE.finditer(text):
         if m.group(2):      # **bold**
             runs.append((m.group(2), True, False, False))
         elif m.group(3):    # *italic*
@@ -239,19 +356,72 @@ def parse_inline(text: str) -> list[tuple]:
 def _is_heading_by_format(para) -> int | None:
     """Detect if a Normal-styled paragraph is actually a heading based on font size.
     Returns heading level (1 or 2) or None."""
-    if not para.runs:
-        return None
-    # Check the largest font size across runs
-    max_size = 0
-    for run in para.runs:
-        if run.font.size:
-            max_size = max(max_size, run.font.size)
+    # Level of the largest font size across runs; stop at the first H1-sized run
     # 16pt+ = H1 (Überschrift), 13pt+ = H2 (Unterüberschrift)
-    if max_size >= 200000:   # ~16pt in EMU
-        return 1
-    elif max_size >= 165000:  # ~13pt in EMU
-        return 2
-    return None
+    level = None
+    for run in para.runs:
+        size = run.font.size
+        if size:
+            if size >= 200000:   # ~16pt in EMU
+                return 1
+            if size >= 165000:   # ~13pt in EMU
+                level = 2
+    return level
+
+
+def _classify_style(style_name: str) -> tuple[str | None, int]:
+    """Map a lower-cased paragraph style name to (block kind, heading level).
+
+    The kind is None for Normal-like styles, whose paragraphs are
+    classified by font size instead.
+    """
+    # Check explicit heading styles
+    if "heading" in style_name or "überschrift" in style_name:
+        level = 1
+        if "unter" in style_name or "zwischen" in style_name or "2" in style_name:
+            level = 2
+        elif "3" in style_name:
+            level = 3
+        return "heading", level
+    if style_name in ("normal", "body text", "default paragraph font", ""):
+        return None, 0
+    if "list" in style_name or "bullet" in style_name or "auflistung" in style_name:
+        return "bullet", 0
+    if "number" in style_name or "aufzählung" in style_name:
+        return "numbered", 0
+    return "paragraph", 0
+
+
+_style_cache: dict[str, tuple[str | None, int]] = {}
+
+
+def _style_kind(style_name: str) -> tuple[str | None, int]:
+    """Memoized _classify_style(); documents reuse a handful of styles."""
+    hit = _style_cache.get(style_name)
+    if hit is None:
+        hit = _classify_style(style_name)
+        _style_cache[style_name] = hit
+    return hit
+
+
+def _docx_runs(para, text: str) -> list[tuple]:
+    """Take (text, bold, italic, underline) runs straight from a .docx paragraph.
+
+    ``text`` is the paragraph's stripped text. If the plain runs do not
+    account for all of it (e.g. hyperlinks), fall back to parsing it as
+    inline markdown.
+    """
+    runs = [(r.text, bool(r.bold), bool(r.italic), bool(r.underline)) for r in para.runs]
+    if "".join(run[0] for run in runs).strip() != text:
+        return parse_inline(text)
+    # Trim the surrounding whitespace that was stripped from text
+    while not runs[0][0].strip():
+        runs.pop(0)
+    while not runs[-1][0].strip():
+        runs.pop()
+    runs[0] = (runs[0][0].lstrip(),) + runs[0][1:]
+    runs[-1] = (runs[-1][0].rstrip(),) + runs[-1][1:]
+    return [run for run in runs if run[0]]
 
 
 def parse_docx_input(filepath: str) -> list[ContentBlock]:
@@ -259,56 +429,33 @@ def parse_docx_input(filepath: str) -> list[ContentBlock]:
     doc = Document(filepath)
     blocks = []
 
-    # Build an ordered list of body elements (paragraphs and tables interleaved)
+    # Walk body elements in order (paragraphs and tables interleaved), wrapping
+    # each one directly rather than building doc.paragraphs / doc.tables
     body = doc.element.body
-    para_index = 0
-    table_index = 0
-    paragraphs = doc.paragraphs
-    tables = doc.tables
-
-    for child in body:
-        tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-        if tag == "p":
-            if para_index < len(paragraphs):
-                para = paragraphs[para_index]
-                para_index += 1
-                text = para.text.strip()
-                if not text:
-                    continue
-                style_name = para.style.name.lower() if para.style else ""
-
-                # Check explicit heading styles
-                if "heading" in style_name or "überschrift" in style_name:
-                    level = 1
-                    if "unter" in style_name or "zwischen" in style_name or "2" in style_name:
-                        level = 2
-                    elif "3" in style_name:
-                        level = 3
-                    blocks.append(ContentBlock("heading", text, level=level))
-                # Check if Normal paragraph looks like a heading (large font)
-                elif style_name in ("normal", "body text", "default paragraph font", ""):
-                    heading_level = _is_heading_by_format(para)
-                    if heading_level:
-                        blocks.append(ContentBlock("heading", text, level=heading_level))
-                    else:
-                        blocks.append(ContentBlock("paragraph", text))
-                elif "list" in style_name or "bullet" in style_name or "auflistung" in style_name:
-                    blocks.append(ContentBlock("bullet", text))
-                elif "number" in style_name or "aufzählung" in style_name:
-                    blocks.append(ContentBlock("numbered", text))
-                else:
-                    blocks.append(ContentBlock("paragraph", text))
-
-        elif tag == "tbl":
-            if table_index < len(tables):
-                table = tables[table_index]
-                table_index += 1
-                rows = []
-                for row in table.rows:
-                    cells = [cell.text.strip() for cell in row.cells]
-                    rows.append(cells)
-                if rows:
-                    blocks.append(ContentBlock("table", "", table_data=rows))
+    for child in body.iterchildren():
+        tag = child.tag
+        if tag == _QN_P:
+            para = Paragraph(child, doc._body)
+            text = para.text.strip()
+            if not text:
+                continue
+            style_name = para.style.name.lower() if para.style else ""
+
+            kind, level = _style_kind(style_name)
+            if kind is None:
+                # Normal paragraph may still look like a heading (large font)
+                level = _is_heading_by_format(para) or 0
+                kind = "heading" if level else "paragraph"
+            blocks.append(ContentBlock(kind, text, level=level, runs=_docx_runs(para, text)))
+
+        elif tag == _QN_TBL:
+            table = Table(child, doc._body)
+            rows = []
+            for row in table.rows:
+                cells = [cell.text.strip() for cell in row.cells]
+                rows.append(cells)
+            if rows:
+                blocks.append(ContentBlock("table", "", table_data=rows))
 
     return blocks
 
@@ -341,29 +488,42 @@ def create_sprind_document(
     _update_footer(section, version=version, date_str=date_str, language=language, is_first_page=True)
     _update_footer(section, version=version, date_str=date_str, language=language, is_first_page=False)
 
-    # Add content
+    # Resolve SPRIND style IDs once instead of a style lookup per paragraph
+    style_ids = {
+        name: doc.styles[name].style_id
+        for name in (STYLE_HEADING, STYLE_SUBHEADING, STYLE_BULLET, STYLE_NUMBERED, STYLE_PARAGRAPH)
+    }
+
+    # Build content detached from the document, then attach it in one go
+    elements = []
     for block in blocks:
         if block.kind == "heading":
-            if block.level <= 1:
-                p = doc.add_paragraph(style=STYLE_HEADING)
-            else:
-                p = doc.add_paragraph(style=STYLE_SUBHEADING)
-            _add_runs(p, block.text)
-
+            style = STYLE_HEADING if block.level <= 1 else STYLE_SUBHEADING
         elif block.kind == "bullet":
-            p = doc.add_paragraph(style=STYLE_BULLET)
-            _add_runs(p, block.text)
-
+            style = STYLE_BULLET
         elif block.kind == "numbered":
-            p = doc.add_paragraph(style=STYLE_NUMBERED)
-            _add_runs(p, block.text)
-
+            style = STYLE_NUMBERED
+        elif block.kind == "paragraph":
+            style = STYLE_PARAGRAPH
         elif block.kind == "table":
-            _add_table(doc, block.table_data)
+            tbl = _build_table(doc, block.table_data)
+            if tbl is not None:
+                elements.append(tbl)
+            continue
+        else:
+            continue
+        p = _new_paragraph(doc, style_ids[style])
+        _add_runs(p, block)
+        elements.append(p._p)
 
-        elif block.kind == "paragraph":
-            p = doc.add_paragraph(style=STYLE_PARAGRAPH)
-            _add_runs(p, block.text)
+    # New content goes before the body-level sectPr, as add_paragraph() would
+    body = doc.element.body
+    sect_pr = body.find(_QN_SECTPR)
+    if sect_pr is not None:
+        for element in elements:
+            sect_pr.addprevious(element)
+    else:
+        body.extend(elements)
 
     doc.save(output_path)
     print(f"Created: {output_path}")
@@ -373,155 +533,152 @@ def create_sprind_document(
 # Footer
 # ---------------------------------------------------------------------------
 
+# Footer text per (language, has version); [FIELD] marks a Word field code
+_FOOTER_TEMPLATES = {
+    # "Version X.Y from DDth Month YYYY, Page N (T)"
+    ("en", True): "Version {version} from {date}, Page [PAGE] ([NUMPAGES])",
+    ("en", False): "Page [PAGE] ([NUMPAGES])",
+    # "Version X.Y vom DD.MM.YYYY   Seite N/T"
+    ("de", True): "Version {version} vom {date}   Seite [PAGE]/[SECTIONPAGES]",
+    ("de", False): "{date}   Seite [PAGE]/[SECTIONPAGES]",
+}
+_FOOTER_FIELD_RE = re.compile(r"\[([A-Z]+)\]")
+
+# Right-aligned, 18pt space before
+_FOOTER_PPR_XML = '<w:pPr><w:spacing w:before="360"/><w:jc w:val="right"/></w:pPr>'
+
+
 def _update_footer(section, version: str | None, date_str: str | None, language: str, is_first_page: bool):
     """Replace footer content with version/date and page numbers."""
-    if is_first_page:
-        footer = section.first_page_footer
-        font_size = Pt(10) if language == "en" else Pt(8)
-    else:
-        footer = section.footer
-        font_size = Pt(10) if language == "en" else Pt(8)
+    footer = section.first_page_footer if is_first_page else section.footer
+    font_size = Pt(10) if language == "en" else Pt(8)
 
     footer.is_linked_to_previous = False
 
     # Clear existing footer content
-    for p in list(footer.paragraphs):
-        for child in list(p._element):
-            p._element.remove(child)
+    for p in footer.paragraphs:
+        del p._element[:]
 
     # Use first existing paragraph or add one
     para = footer.paragraphs[0] if footer.paragraphs else footer.add_paragraph()
-    para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    para.paragraph_format.space_before = Twips(360)
 
     if language == "en":
-        # "Version X.Y from DDth Month YYYY, Page N (T)"
-        prefix = ""
-        if version:
-            date_formatted = format_date_english(date_str)
-            prefix = f"Version {version} from {date_formatted}, Page "
-        else:
-            prefix = "Page "
-        run = para.add_run(prefix)
-        _set_run_font(run, FONT_BODY, font_size)
-        _add_field(para, "PAGE", FONT_BODY, font_size)
-        run2 = para.add_run(" (")
-        _set_run_font(run2, FONT_BODY, font_size)
-        _add_field(para, "NUMPAGES", FONT_BODY, font_size)
-        run3 = para.add_run(")")
-        _set_run_font(run3, FONT_BODY, font_size)
+        date_formatted = format_date_english(date_str) if version else ""
     else:  # German
-        # "Version X.Y vom DD.MM.YYYY   Seite N/T"
         date_formatted = format_date_german(date_str)
-        if version:
-            prefix = f"Version {version} vom {date_formatted}   Seite "
-        else:
-            prefix = f"{date_formatted}   Seite "
-        run = para.add_run(prefix)
-        _set_run_font(run, FONT_BODY, font_size)
-        _add_field(para, "PAGE", FONT_BODY, font_size)
-        run2 = para.add_run("/")
-        _set_run_font(run2, FONT_BODY, font_size)
-        _add_field(para, "SECTIONPAGES", FONT_BODY, font_size)
-
-
-def _add_field(paragraph, field_name: str, font_name: str, font_size):
-    """Add a Word field code (PAGE, NUMPAGES, SECTIONPAGES) to a paragraph."""
-    run = paragraph.add_run()
-    _set_run_font(run, font_name, font_size)
-    fld_char_begin = OxmlElement("w:fldChar")
-    fld_char_begin.set(qn("w:fldCharType"), "begin")
-    run._element.append(fld_char_begin)
-
-    run2 = paragraph.add_run()
-    _set_run_font(run2, font_name, font_size)
-    instr = OxmlElement("w:instrText")
-    instr.set(qn("xml:space"), "preserve")
-    instr.text = f" {field_name} "
-    run2._element.append(instr)
-
-    run3 = paragraph.add_run()
-    _set_run_font(run3, font_name, font_size)
-    fld_char_separate = OxmlElement("w:fldChar")
-    fld_char_separate.set(qn("w:fldCharType"), "separate")
-    run3._element.append(fld_char_separate)
-
-    run4 = paragraph.add_run("1")
-    _set_run_font(run4, font_name, font_size)
-
-    run5 = paragraph.add_run()
-    _set_run_font(run5, font_name, font_size)
-    fld_char_end = OxmlElement("w:fldChar")
-    fld_char_end.set(qn("w:fldCharType"), "end")
-    run5._element.append(fld_char_end)
-
-
-def _set_run_font(run, font_name: str, font_size):
-    """Set font name and size on a run."""
-    run.font.name = font_name
-    run.font.size = font_size
-    run.font.color.rgb = RGBColor(0, 0, 0)
-    rpr = run._element.get_or_add_rPr()
-    rfonts = rpr.find(qn("w:rFonts"))
-    if rfonts is None:
-        rfonts = OxmlElement("w:rFonts")
-        rpr.insert(0, rfonts)
-    rfonts.set(qn("w:ascii"), font_name)
-    rfonts.set(qn("w:hAnsi"), font_name)
-    rfonts.set(qn("w:cs"), font_name)
+    template = _footer_xml("en" if language == "en" else "de", bool(version), FONT_BODY, int(font_size.pt * 2))
+    footer_p = parse_xml(template.format(version=escape(version or ""), date=escape(date_formatted)))
+    para._p.extend(list(footer_p))
+
+
+def _run_rpr_xml(font_name: str, size_hpt: int) -> str:
+    """Return the ``w:rPr`` markup for body-font runs (size in half-points)."""
+    font = quoteattr(font_name)
+    return (
+        f"<w:rPr><w:rFonts w:ascii={font} w:hAnsi={font} w:cs={font}/>"
+        f'<w:color w:val="000000"/><w:sz w:val="{size_hpt}"/></w:rPr>'
+    )
+
+
+def _field_runs_xml(field_name: str, rpr: str) -> str:
+    """Return the five runs of a Word field code (PAGE, NUMPAGES, SECTIONPAGES)."""
+    return (
+        f'<w:r>{rpr}<w:fldChar w:fldCharType="begin"/></w:r>'
+        f'<w:r>{rpr}<w:instrText xml:space="preserve"> {escape(field_name)} </w:instrText></w:r>'
+        f'<w:r>{rpr}<w:fldChar w:fldCharType="separate"/></w:r>'
+        f"<w:r>{rpr}<w:t>1</w:t></w:r>"
+        f'<w:r>{rpr}<w:fldChar w:fldCharType="end"/></w:r>'
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _footer_xml(language: str, has_version: bool, font_name: str, size_hpt: int) -> str:
+    """Render a footer template to paragraph markup once per shape.
+
+    The result still contains the ``{version}`` and ``{date}`` placeholders
+    for str.format().
+    """
+    rpr = _run_rpr_xml(font_name, size_hpt)
+    parts = [f"<w:p {nsdecls('w')}>", _FOOTER_PPR_XML]
+    # split() alternates literal text and captured field names
+    for i, chunk in enumerate(_FOOTER_FIELD_RE.split(_FOOTER_TEMPLATES[language, has_version])):
+        if i % 2:
+            parts.append(_field_runs_xml(chunk, rpr))
+        elif chunk:
+            parts.append(f"<w:r>{rpr}{_run_content_xml(chunk)}</w:r>")
+    parts.append("</w:p>")
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
 # Content helpers
 # ---------------------------------------------------------------------------
 
-def _add_table(doc, table_data: list):
-    """Add a table to the document with SPRIND body font styling."""
+def _new_paragraph(doc, style_id: str) -> Paragraph:
+    """Create a detached paragraph with the given paragraph style ID."""
+    p = OxmlElement("w:p")
+    p.style = style_id
+    return Paragraph(p, doc._body)
+
+
+def _build_table(doc, table_data: list):
+    """Build a detached table with SPRIND body font styling.
+
+    Returns the ``w:tbl`` element, or None if there is nothing to add.
+    """
     if not table_data:
-        return
-    rows = len(table_data)
+        return None
     cols = len(table_data[0]) if table_data else 0
     if cols == 0:
-        return
+        return None
 
-    table = doc.add_table(rows=rows, cols=cols)
+    # Columns share the text width evenly, as in python-docx's add_table()
+    col_twips = Emu(doc._block_width // cols).twips
+    grid = f'<w:gridCol w:w="{col_twips}"/>' * cols
+    tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_twips}"/></w:tcPr>'
 
+    rows = []
     for i, row_data in enumerate(table_data):
-        row = table.rows[i]
-        for j, cell_text in enumerate(row_data):
-            if j < len(row.cells):
-                cell = row.cells[j]
-                # Clear default paragraph and add styled one
-                cell.text = ""
-                p = cell.paragraphs[0]
-                run = p.add_run(cell_text)
-                run.font.name = FONT_BODY
-                run.font.size = Pt(11)
-                run.font.color.rgb = RGBColor(0, 0, 0)
-                # Set hAnsi font
-                rpr = run._element.get_or_add_rPr()
-                rfonts = rpr.find(qn("w:rFonts"))
-                if rfonts is None:
-                    rfonts = OxmlElement("w:rFonts")
-                    rpr.insert(0, rfonts)
-                rfonts.set(qn("w:ascii"), FONT_BODY)
-                rfonts.set(qn("w:hAnsi"), FONT_BODY)
+        cells = []
+        for j in range(cols):
+            if j < len(row_data):
                 # Bold first row (header) or first column (key-value tables)
-                if i == 0 or (cols == 2 and j == 0):
-                    run.bold = True
-
-
-def _add_runs(paragraph, text: str):
-    """Add inline-formatted runs to a paragraph."""
-    runs = parse_inline(text)
-    for text_chunk, bold, italic, underline in runs:
-        run = paragraph.add_run(text_chunk)
-        if bold:
-            run.bold = True
-        if italic:
-            run.italic = True
-        if underline:
-            run.underline = True
+                rpr = _TABLE_RPR_XML[i == 0 or (cols == 2 and j == 0)]
+                content = f"<w:p><w:r>{rpr}{_run_content_xml(row_data[j])}</w:r></w:p>"
+            else:
+                content = "<w:p/>"
+            cells.append(f"<w:tc>{tc_pr}{content}</w:tc>")
+        rows.append(f"<w:tr>{''.join(cells)}</w:tr>")
+
+    return parse_xml(
+        f"<w:tbl {nsdecls('w')}>{_TABLE_PR_XML}"
+        f"<w:tblGrid>{grid}</w:tblGrid>{''.join(rows)}</w:tbl>"
+    )
+
+
+def _run_content_xml(text: str) -> str:
+    """Return run content markup for text, matching python-docx's add_run()."""
+    parts = []
+    for chunk in _RUN_BREAK_RE.split(text):
+        if chunk == "\t":
+            parts.append("<w:tab/>")
+        elif chunk in ("\r", "\n"):
+            parts.append("<w:br/>")
+        elif chunk:
+            space = ' xml:space="preserve"' if chunk.strip() != chunk else ""
+            parts.append(f"<w:t{space}>{escape(chunk)}</w:t>")
+    return "".join(parts)
+
+
+def _add_runs(paragraph, block: ContentBlock):
+    """Add a block's inline-formatted runs to a paragraph."""
+    runs = block.runs if block.runs is not None else parse_inline(block.text)
+    runs = "".join(
+        f"<w:r>{_INLINE_RPR_XML[bold, italic, underline]}{_run_content_xml(text_chunk)}</w:r>"
+        for text_chunk, bold, italic, underline in runs
+    )
+    fragment = parse_xml(f"<w:p {nsdecls('w')}>{runs}</w:p>")
+    paragraph._p.extend(list(fragment))
 
 
 # ---------------------------------------------------------------------------